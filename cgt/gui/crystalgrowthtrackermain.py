@@ -250,6 +250,7 @@ class CrystalGrowthTrackerMain(qw.QMainWindow, Ui_CrystalGrowthTrackerMain):
                 None
         """
         self._propertiesWidget.clear_and_display_text("<h1>Properties</h1>")
+        self._project.wait_for_host_info()
         for key in self._project:
             text = "<p><b>{}:</b> {}"
             text = text.format(key, self._project[key])
@@ -646,12 +647,7 @@ class CrystalGrowthTrackerMain(qw.QMainWindow, Ui_CrystalGrowthTrackerMain):
                 True if has marker else false
         """
         index = self._project["results"].get_regions().index(region)
-        markers = []
-        markers.append(self._project["results"].get_lines_for_region(index))
-        markers.append(self._project["results"].get_points_for_region(index))
-        markers = [x for x in markers if x is not None]
-
-        return len(markers)>0
+        return self._project["results"].region_has_markers(index)
 
     def append_lines(self, region_index, lines):
         """
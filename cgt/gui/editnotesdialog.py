@@ -94,13 +94,14 @@ class EditNotesDialog(qw.QDialog, Ui_EditNotesDialog):
 
 def run_main():
     """
-    use a local function to make an isolated the QApplication object
+    use a local function to make an isolated the QApplication object,
+    an existing QApplication is reused so it is safe to call in-process
 
         Returns:
             None
     """
 
-    app = qw.QApplication(sys.argv)
+    app = qw.QApplication.instance() or qw.QApplication(sys.argv)
     window = EditNotesDialog()
     window.show()
     app.exec_()
@@ -145,17 +145,21 @@ class MarkUpWidget(qw.QWidget, Ui_MarkUpWidget):
         if self._results_proxy is None:
             return
 
-        self._regionsBox.blockSignals(True)
         all_regions = self._results_proxy.get_regions()
         index = self._regionsBox.currentIndex()
-        self._regionsBox.clear()
 
-        for i in range(len(all_regions)):
-            self._regionsBox.addItem(f"Region {i}")
-
-        if index > -1:
-            self._regionsBox.setCurrentIndex(index)
-        self._regionsBox.blockSignals(False)
+        # a single repaint, and no change signals while the list is rebuilt
+        self._regionsBox.setUpdatesEnabled(False)
+        blocker = qc.QSignalBlocker(self._regionsBox)
+        try:
+            self._regionsBox.clear()
+            self._regionsBox.addItems([f"Region {i}" for i in range(len(all_regions))])
+
+            if index > -1:
+                self._regionsBox.setCurrentIndex(index)
+        finally:
+            blocker.unblock()
+            self._regionsBox.setUpdatesEnabled(True)
 
         if self._video_source is not None:
             self.region_changed()
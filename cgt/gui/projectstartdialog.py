@@ -203,13 +203,14 @@ class ProjectStartDialog(qw.QDialog, Ui_ProjectStartDialog):
 
 def run():
     """
-    use a local function to make an isolated the QApplication object
+    use a local function to make an isolated the QApplication object,
+    an existing QApplication is reused so it is safe to call in-process
 
         Returns:
             None
     """
 
-    app = qw.QApplication(sys.argv)
+    app = qw.QApplication.instance() or qw.QApplication(sys.argv)
 
     window = ProjectStartDialog()
     window.show()
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+## @package regionslistmodel
+# a list model giving views access to the regions of a results store
+#
+# @copyright 2021 University of Leeds, Leeds, UK.
+# @author j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
+"""
+Created on Fri 15 Oct 2021
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use
+this file except in compliance with the License. You may obtain a copy of the
+License at http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed
+under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+
+This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
+"""
+# set up linting conditions
+# pylint: disable = c-extension-no-member
+# pylint: disable = invalid-name
+
+import PyQt5.QtCore as qc
+
+class RegionsListModel(qc.QAbstractListModel):
+    """
+    a read only list model of the regions in a results store, the labels
+    are made on demand so only the rows a view shows are ever formatted
+    """
+
+    def __init__(self, parent=None):
+        """
+        initalize the object
+            Args:
+                parent (QObject): the parent object
+        """
+        super().__init__(parent)
+
+        ## the results store holding the regions
+        self._results = None
+
+    def set_results(self, results):
+        """
+        set a new results store and reset any attached views
+            Args:
+                results (VideoAnalysisResultsStore): the store, may be None
+        """
+        self.beginResetModel()
+        self._results = results
+        self.endResetModel()
+
+    def rowCount(self, parent=qc.QModelIndex()):
+        """
+        the number of rows in the model
+            Args:
+                parent (QModelIndex): parent index, must be invalid for a list
+            Returns:
+                the number of regions (int)
+        """
+        if parent.isValid() or self._results is None:
+            return 0
+
+        return len(self._results.get_regions())
+
+    def data(self, index, role=qc.Qt.DisplayRole):
+        """
+        get the data for an index
+            Args:
+                index (QModelIndex): the index
+                role (Qt.ItemDataRole): the role
+            Returns:
+                the label for display role, else an invalid QVariant
+        """
+        if not index.isValid() or role != qc.Qt.DisplayRole:
+            return qc.QVariant()
+
+        return str(index.row())
@@ -28,6 +28,7 @@ import PyQt5.QtCore as qc
 import PyQt5.QtGui as qg
 
 from cgt.model.velocitiescalculator import VelocitiesCalculator
+from cgt.gui.regionslistmodel import RegionsListModel
 from cgt.io.mpl import make_mplcanvas, draw_displacements
 from cgt.util.markers import (ItemDataTypes,
                               MarkerTypes,
@@ -77,6 +78,15 @@ class ResultsWidget(qw.QWidget, Ui_ResultsWidget):
         # the start points
         self._points = None
 
+        ## model providing the region labels for the region combobox
+        self._regions_model = RegionsListModel(self)
+        self._regionBox.setModel(self._regions_model)
+        self._regionBox.view().setUniformItemSizes(True)
+        self._regionBox.view().setLayoutMode(qw.QListView.Batched)
+
+        ## (id, change count) of the results last shown in the region combobox
+        self._regions_key = None
+
         # ensure view has a scene graph
         self._regionView.setScene(qw.QGraphicsScene())
 
@@ -119,12 +129,19 @@ class ResultsWidget(qw.QWidget, Ui_ResultsWidget):
             return
 
         old_index = self._regionBox.currentIndex()
-        self._regionBox.clear()
-
-        for i in range(len(results.get_regions())):
-            self._regionBox.addItem(str(i))
-
-        if len(results.get_regions()) > 0:
+        regions_key = (id(results), results.get_change_count())
+        if regions_key != self._regions_key:
+            # a single repaint, and no show_results call from the model reset
+            self._regionBox.setUpdatesEnabled(False)
+            blocker = qc.QSignalBlocker(self._regionBox)
+            try:
+                self._regions_model.set_results(results)
+            finally:
+                blocker.unblock()
+                self._regionBox.setUpdatesEnabled(True)
+            self._regions_key = regions_key
+
+        if self._regions_model.rowCount() > 0:
             old_index = max(old_index, 0)
             self.show_results(old_index)
 
@@ -287,12 +304,19 @@ class ResultsWidget(qw.QWidget, Ui_ResultsWidget):
 
     def clear(self):
         """
-        clear up for new results
+        clear up for new results, updates are suspended so the widget repaints once
         """
-        self._resultsTable.clear()
-        self._graph.axes.clear()
-        self._graph.draw()
-        self._graph.flush_events()
+        self.setUpdatesEnabled(False)
+        try:
+            self._regions_model.set_results(None)
+            self._regions_key = None
+            self._resultsTable.clear()
+            self._graph.axes.clear()
+            self._graph.draw()
+            self._graph.flush_events()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
 def clone_line(marker, pen):
     """
@@ -196,6 +196,7 @@ def write_html_report_start(fout, project):
     date, time = to_date_and_time(timestamp)
     fout.write(f"<p>Report generated on: {date} at {time} by {getpass.getuser()}</p>\n")
 
+    project.wait_for_host_info()
     tmp = project['start_datetime']
     date, time = to_date_and_time(datetime.strptime(tmp, '%Y-%m-%d_%H-%M-%S'))
     fout.write(f"<p>This project was started on {date} at {time} by "+project['start_user']+" on machine "+project['host']+".</p>\n")
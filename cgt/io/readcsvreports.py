@@ -33,8 +33,8 @@ import PyQt5.QtWidgets as qw
 from cgt.util.framestats import FrameStats, VideoIntensityStats
 from cgt.util.markers import(get_region,
                              get_frame)
-from cgt.util.scenegraphitems import (list_to_g_point,
-                                      list_to_g_line)
+from cgt.util.scenegraphitems import (list_to_g_points,
+                                      list_to_g_lines)
 
 def read_csv_project(results_dir, new_project, pens):
     '''Coordinates the reading of a selection of csv reports.
@@ -199,15 +199,14 @@ def read_csv_points(new_project, files, path, pens):
 
     rows.sort(key=operator.itemgetter(6))
 
+    pen = pens.get_display_pen()
     for _, region_iterator in itertools.groupby(rows, operator.itemgetter(6)):
         region_group = list(region_iterator)
         region_group.sort(key=operator.itemgetter(0))
         for _, point_iterator in itertools.groupby(region_group, operator.itemgetter(0)):
             point_group = list(point_iterator)
             point_group.sort(key=operator.itemgetter(5))
-            g_marker = []
-            for row in point_group:
-                g_marker.append(list_to_g_point(row, pens.get_display_pen()))
+            g_marker = list_to_g_points(point_group, pen)
 
             new_project["results"].insert_point_marker(g_marker)
 
@@ -242,15 +241,14 @@ def read_csv_lines(new_project, files, path, pens):
 
     rows.sort(key=operator.itemgetter(8))
 
+    pen = pens.get_display_pen()
     for _, region_iterator in itertools.groupby(rows, operator.itemgetter(8)):
         region_group = list(region_iterator)
         region_group.sort(key=operator.itemgetter(0))
         for _, line_iterator in itertools.groupby(region_group, operator.itemgetter(0)):
             line_group = list(line_iterator)
             line_group.sort(key=operator.itemgetter(7))
-            g_marker = []
-            for row in line_group:
-                g_marker.append(list_to_g_line(row, pens.get_display_pen()))
+            g_marker = list_to_g_lines(line_group, pen)
 
             new_project["results"].insert_line_marker(g_marker)
 
@@ -101,6 +101,7 @@ def save_csv_info(info):
         Throws:
             IOException if file cannot be opened
     '''
+    info.wait_for_host_info()
     path = pathlib.Path(info["proj_full_path"])
     csv_outfile_name = info["prog"] + r"_" + info["proj_name"] + r"_project_info.csv"
 
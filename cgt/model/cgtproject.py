@@ -25,10 +25,39 @@ This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
 # set up linting conditions
 
 import getpass
+import threading
 import numpy as np
 
+import PyQt5.QtCore as qc
+
 from cgt.util.utils import timestamp, find_hostname_and_ip
 
+## the keys of a project in the order they are stored and saved
+_DEFAULT_KEYS = ("prog",                         # program name
+                 "description",                  # program description
+                 "start_datetime",               # a time stamp for the start of the project
+                 "host",                         # name of computer on which we are running
+                 "ip_address",                   # ip address of computer on which the project started
+                 "operating_system",             # operating system on we which the project started
+                 "enhanced_video",               # the video on which the program will operate
+                 "raw_video",                    # the original video before image enhancment, may be null
+                 "proj_name",                    # the name of the project
+                 "proj_full_path",               # the full path to the project
+                 "notes",                        # the users notes
+                 "results",                      # the results
+                 "enhanced_video_path",          # the path to the enhanced_video
+                 "enhanced_video_no_path",       # the plain file name of the enhanced_video
+                 "enhanced_video_no_extension",  # the file name of the enhanced_video without postfix
+                 "raw_video_path",               # the path to the raw_video video file
+                 "raw_video_no_path",            # the plain file name of the raw_video video file
+                 "raw_video_no_extension",       # the file extension of the raw_video video file
+                 "stats_from_enhanced",          # if raw and enhanced vidoes supplied calc stats using enhanced
+                 "start_user",                   # the user who stated the project
+                 "frame_rate",                   # the video frame rate
+                 "resolution",                   # the real world distance represented by the edge length of a pixel
+                 "resolution_units",             # the units of the resolution
+                 "latest_report")                # path to latest saved report
+
 class CGTProject(dict):
     """
     a store for a the project data and results
@@ -37,9 +66,9 @@ class CGTProject(dict):
         prog: (string) name of program
         description: (string) description of the program
         start_datetime: (string) timestamp of start of project
-        host: (string) name of computer
-        ip_address: (string) ip address of computer
-        operating_system: (string) operating system of computer
+        host: (string) name of computer, see wait_for_host_info
+        ip_address: (string) ip address of computer, see wait_for_host_info
+        operating_system: (string) operating system of computer, see wait_for_host_info
         enhanced_video_path: (pathlib.Path) the full path of the image enhanced video
         enhanced_video_no_path: the name of the enhanced video file
         enhanced_video_no_extension: name of the enhanced video file without extension
@@ -53,6 +82,10 @@ class CGTProject(dict):
         resolution_units: (string) the units of size of a pixel
         results: (VideoAnalysisResultsStore) the results
     """
+
+    # the non-dictionary state, held in slots so instances carry no __dict__
+    __slots__ = ("_changed", "_host_info_ready")
+
     def __init__(self):
         """
         initalize the class
@@ -62,80 +95,17 @@ class CGTProject(dict):
         """
         super().__init__()
 
-        ## a flag to indicate the dictionary has been changed. can be unset after a save
-        self._changed = False
-
-        # program name
-        self["prog"] = None
-
-        # program description
-        self["description"] = None
-
-        # a time stamp for the start of the project
-        self["start_datetime"] = None
-
-        # name of computer on which we are running
-        self['host'] = None
-
-        # ip address of computer on which the project started
-        self['ip_address'] = None
-
-        # operating system on we which the project started
-        self['operating_system'] = None
-
-        # the video on which the program will operate
-        self["enhanced_video"] = None
-
-        # the original video before image enhancment, may be null
-        self["raw_video"] = None
-
-        # the name of the project
-        self["proj_name"] = None
-
-        # the full path to the project
-        self["proj_full_path"] = None
-
-        # the users notes
-        self["notes"] = None
-
-        # the results
-        self["results"] = None
+        # bulk insert the defaults via dict to leave the changed flag unset
+        dict.update(self, dict.fromkeys(_DEFAULT_KEYS))
 
-        # the path to the enhanced_video
-        self["enhanced_video_path"] = None
+        # the only key not starting as None
+        dict.__setitem__(self, "stats_from_enhanced", False)
 
-        # the plain file name of the enhanced_video
-        self['enhanced_video_no_path'] = None
-
-        # the file name of the enhanced_video without postfix
-        self['enhanced_video_no_extension'] = None
-
-        # the path to the raw_video video file
-        self['raw_video_path'] = None
-
-        # the plain file name of the raw_video video file
-        self['raw_video_no_path'] = None
-
-        # the file extension of the raw_video video file
-        self['raw_video_no_extension'] = None
-
-        # when raw and enhanced vidoes supplied calc stats using enhanced
-        self["stats_from_enhanced"] = False
-
-        # the user who stated the project
-        self['start_user'] = None
-
-        # the video frame rate
-        self['frame_rate'] = None
-
-        # the real world distance represented by the edge length of a pixel
-        self['resolution'] = None
-
-        # the units of the resolution
-        self['resolution_units'] = None
+        ## a flag to indicate the dictionary has been changed. can be unset after a save
+        self._changed = False
 
-        # path to latest saved report
-        self["latest_report"] = None
+        ## set when a background host lookup has completed, None if no lookup started
+        self._host_info_ready = None
 
     def init_new_project(self):
         """
@@ -147,15 +117,49 @@ class CGTProject(dict):
         self["prog"] = prog
         self["description"] = description
         self["start_datetime"] = timestamp()
-        self['host'], self['ip_address'], self['operating_system'] = find_hostname_and_ip()
         self["start_user"] = getpass.getuser()
 
+        # the host lookup can take seconds on a badly configured network
+        self._host_info_ready = threading.Event()
+        qc.QThreadPool.globalInstance().start(self.find_host_info)
+
+    def find_host_info(self):
+        """
+        look up the host, ip address and operating system, run in a worker thread,
+        any failure records the values as undetermined and the ready flag is always set
+        """
+        host = ip_address = operating_system = 'undetermined'
+
+        # an exception escaping a QThreadPool worker aborts the process, so catch all
+        try:
+            host, ip_address, operating_system = find_hostname_and_ip()
+        except Exception: # pylint: disable = broad-except
+            pass
+        finally:
+            # bypass __setitem__, the values are part of creating the project, not a change
+            dict.__setitem__(self, 'host', host)
+            dict.__setitem__(self, 'ip_address', ip_address)
+            dict.__setitem__(self, 'operating_system', operating_system)
+
+            self._host_info_ready.set()
+
+    def wait_for_host_info(self):
+        """
+        block until any background host lookup started by init_new_project has finished,
+        must be called before the host, ip_address or operating_system are read
+        """
+        if self._host_info_ready is not None:
+            self._host_info_ready.wait()
+
     def ensure_numeric(self):
         """
-        ensure that numeric data is converted from string on load from file
+        ensure that numeric data is converted from string on load from file,
+        values that are already numpy floats, or unset (None), are left untouched
         """
-        self["resolution"] = np.float64(float(self["resolution"]))
-        self["frame_rate"] = np.float64(float(self["frame_rate"]))
+        for key in ("resolution", "frame_rate"):
+            # np.float64(None) is nan, which would silently give nan velocities
+            if self[key] is not None and not isinstance(self[key], np.floating):
+                self[key] = np.float64(self[key])
 
     def __setitem__(self, item, value):
         """
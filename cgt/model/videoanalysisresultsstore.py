@@ -86,6 +86,9 @@ class VideoAnalysisResultsStore(qc.QObject):
         ## flag to indicate store has been changed
         self._changed = False
 
+        ## count of changes, never reset, lets views tell if their copy is stale
+        self._change_count = 0
+
     def has_been_changed(self):
         """
         getter for the changed status
@@ -111,9 +114,18 @@ class VideoAnalysisResultsStore(qc.QObject):
             Returns:
                 None
         """
+        self._change_count += 1
         self.data_changed.emit(value)
         self._changed = True
 
+    def get_change_count(self):
+        """
+        getter for the number of changes made since creation
+            Returns:
+                the change count (int)
+        """
+        return self._change_count
+
     def get_video_statistics(self):
         """
         getter for the video statistics
@@ -588,6 +600,26 @@ class VideoAnalysisResultsStore(qc.QObject):
 
         return None
 
+    def number_of_lines_for_region(self, index):
+        """
+        count the lines associated with a region, without building a list
+            Args:
+                index (int) array index of region
+            Returns:
+                the number of lines (int)
+        """
+        return sum(1 for line in self._lines if get_region(line[0]) == index)
+
+    def number_of_points_for_region(self, index):
+        """
+        count the points associated with a region, without building a list
+            Args:
+                index (int) array index of region
+            Returns:
+                the number of points (int)
+        """
+        return sum(1 for point in self._points if get_region(point[0]) == index)
+
     def region_has_markers(self, index):
         """
         find if a region has associated markers defined.
@@ -596,13 +628,11 @@ class VideoAnalysisResultsStore(qc.QObject):
             Returns:
                 True if markers defined else False
         """
-        if len(self.get_points_for_region(index)) > 0:
+        # any() stops at the first marker found
+        if any(get_region(point[0]) == index for point in self._points):
             return True
 
-        if len(self.get_lines_for_region(index)) > 0:
-            return True
-
-        return False
+        return any(get_region(line[0]) == index for line in self._lines)
 
     def change_marker_props(self, pens):
         """
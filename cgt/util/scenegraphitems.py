@@ -18,7 +18,9 @@ This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
 '''
 # set up linting conditions
 # pylint: disable = c-extension-no-member
-from math import (sqrt, isfinite)
+from math import (sqrt, hypot, isfinite, nan)
+
+import numpy as np
 
 import PyQt5.QtGui as qg
 import PyQt5.QtCore as qc
@@ -46,19 +48,10 @@ def difference_list_to_velocities(diff_list, scale, fps):
             fps (int) the number of frames per second
         Returns:
             a list of velocities
+        Throws:
+            ZeroDivisionError if any frame interval is zero
     """
-    velocities = []
-    for frames, diff in diff_list:
-        distance = difference_to_distance(diff, scale)
-        time = frames/fps
-        velocity = distance/time
-
-        if velocity < 0.0:
-            velocities.append(-velocity)
-        else:
-            velocities.append(velocity)
-
-    return velocities
+    return [abs(difference_to_distance(diff, scale)*fps/frames) for frames, diff in diff_list]
 
 def rectangle_properties(rectangle):
     """
@@ -87,7 +80,7 @@ def qpoint_sepertation_squared(point_a, point_b):
             the square of the distance from a to b
     """
     difference = point_a - point_b
-    return difference.x()*difference.x() + difference.y()*difference.y()
+    return qc.QPointF.dotProduct(difference, difference)
 
 def make_positive_rect(corner, opposite_corner):
     """
@@ -114,13 +107,11 @@ def length_squared(point):
         Returns
             square of length
     """
-    return point.x()*point.x() + point.y()*point.y()
+    return qc.QPointF.dotProduct(point, point)
 
-def make_cross_path(point):
+def make_cross_template():
     """
-    make the path object corresponding to a cross centred at a scene point
-        Args:
-            point (QPointF) location in scene coordinates
+    make the path object corresponding to a cross centred at the origin
         Returns:
             the path (QPainterPath) for the cross
     """
@@ -128,18 +119,99 @@ def make_cross_path(point):
 
     up_right = qc.QPointF(10.0, 10.0)
     up_left = qc.QPointF(-10.0, 10.0)
+    origin = qc.QPointF(0.0, 0.0)
 
-    path.moveTo(point)
-    path.lineTo(point+up_right)
-    path.moveTo(point)
-    path.lineTo(point+up_left)
-    path.moveTo(point)
-    path.lineTo(point-up_right)
-    path.moveTo(point)
-    path.lineTo(point-up_left)
+    path.moveTo(origin)
+    path.lineTo(up_right)
+    path.moveTo(origin)
+    path.lineTo(up_left)
+    path.moveTo(origin)
+    path.lineTo(-up_right)
+    path.moveTo(origin)
+    path.lineTo(-up_left)
 
     return path
 
+## the cross at the origin, translated to make each marker's path
+_CROSS_TEMPLATE = make_cross_template()
+
+def make_cross_path(point):
+    """
+    make the path object corresponding to a cross centred at a scene point
+        Args:
+            point (QPointF) location in scene coordinates
+        Returns:
+            the path (QPainterPath) for the cross
+    """
+    return _CROSS_TEMPLATE.translated(point)
+
+class LinePairIntersector():
+    """
+    finds the intersections of lines with a fixed clone line, the clone's
+    start and direction are extracted once and reused for every intersection
+    """
+
+    def __init__(self, clone):
+        """
+        initalize the object
+            Args:
+                clone (QLineF) the clone
+        """
+        start = clone.p1()
+        end = clone.p2()
+
+        ## the clone line
+        self._clone = clone
+
+        ## x coordinate of start of the clone
+        self._p1_x = start.x()
+
+        ## y coordinate of start of the clone
+        self._p1_y = start.y()
+
+        ## x component of the clone reversed (p1-p2)
+        self._b_x = start.x() - end.x()
+
+        ## y component of the clone reversed (p1-p2)
+        self._b_y = start.y() - end.y()
+
+    def intersect(self, centred_normal):
+        """
+        find intersection of centred_normal and the clone
+            Args:
+                centred_normal (QLineF) the normal vector
+            Returns:
+                intersection (QPointF) the intersection point
+                extensiong (QLineF) the extension to clone if needed, else None
+        """
+        ## based on Graphics Gems III's "Faster Line Segment Intersection"
+        start = centred_normal.p1()
+        end = centred_normal.p2()
+        a_x = end.x() - start.x()
+        a_y = end.y() - start.y()
+        c_x = start.x() - self._p1_x
+        c_y = start.y() - self._p1_y
+
+        # test if parallel
+        denominator = a_y * self._b_x - a_x * self._b_y
+        if denominator == 0 or not isfinite(denominator):
+            raise ArithmeticError("Clone line is parallel to parent")
+
+        # find the intersection
+        reciprocal = 1.0 / denominator
+        na = (self._b_y * c_x - self._b_x * c_y) * reciprocal
+        intersection = qc.QPointF(start.x() + a_x * na, start.y() + a_y * na)
+
+        # test if outside clone segmet and assign extension as required
+        nb = (a_x * c_y - a_y * c_x) * reciprocal
+        extension = None
+        if nb < 0.0:
+            extension = qc.QLineF(self._clone.p1(), intersection)
+        elif nb > 1.0:
+            extension = qc.QLineF(self._clone.p2(), intersection)
+
+        return intersection, extension
+
 def cgt_intersection(centred_normal, clone):
     """
     find intersection of centred_normal and clone
@@ -150,30 +222,7 @@ def cgt_intersection(centred_normal, clone):
             intersection (QPointF) the intersection point
             extensiong (QLineF) the extension to clone if needed, else None
     """
-    ## based on Graphics Gems III's "Faster Line Segment Intersection"
-    a = centred_normal.p2() - centred_normal.p1()
-    b = clone.p1() - clone.p2()
-    c = centred_normal.p1() - clone.p1()
-
-    # test if parallel
-    denominator = a.y() * b.x() - a.x() * b.y()
-    if denominator == 0 or not isfinite(denominator):
-        raise ArithmeticError("Clone line is parallel to parent")
-
-    # find the intersection
-    reciprocal = 1.0 / denominator
-    na = (b.y() * c.x() - b.x() * c.y()) * reciprocal
-    intersection = centred_normal.p1() + (a * na)
-
-    # test if outside clone segmet and assign extension as required
-    nb = (a.x() * c.y() - a.y() * c.x()) * reciprocal
-    extension = None
-    if nb < 0.0:
-        extension = qc.QLineF(clone.p1(), intersection)
-    elif nb > 1.0:
-        extension = qc.QLineF(clone.p2(), intersection)
-
-    return intersection, extension
+    return LinePairIntersector(clone).intersect(centred_normal)
 
 def make_arrow_head(line, length_cutoff=10):
     """
@@ -184,11 +233,12 @@ def make_arrow_head(line, length_cutoff=10):
         Returns:
             QPolygon the triangle
     """
-    if line.length() < length_cutoff:
+    length = line.length()
+    if length < length_cutoff:
         return None
 
     # make normal based at p2
-    delta_t = (line.length()-10.0)/line.length()
+    delta_t = (length-10.0)/length
     normal = line.normalVector()
     offset = line.pointAt(delta_t)-line.p1()
     offset_normal = qc.QLineF(normal.p1()+offset, normal.p2()+offset)
@@ -227,10 +277,22 @@ def perpendicular_dist_to_position(gline, scale):
         Args:
             gline (QGraphicsLine): the line
             scale (float): the pixel scale
+        Returns:
+            the distance (float), nan if the line has zero length
     """
-    unit_normal = gline.line().normalVector().unitVector()
-    del_x = gline.pos().x()*unit_normal.dx()*scale
-    del_y = gline.pos().y()*unit_normal.dy()*scale
+    # the unit normal (dy, -dx)/length, found without making the two QLineF of unitVector()
+    line = gline.line()
+    position = gline.pos()
+    vec_x = line.dx()
+    vec_y = line.dy()
+    length = hypot(vec_x, vec_y)
+
+    # a zero length line has no normal, as with unitVector() the result is nan
+    if length == 0.0:
+        return nan
+
+    del_x = position.x()*(vec_y/length)*scale
+    del_y = position.y()*(-vec_x/length)*scale
 
     return sqrt(del_x*del_x + del_y*del_y)
 
@@ -251,6 +313,24 @@ def rect_to_tuple(rect):
 
     return array
 
+## the fields of a point marker in the arrays made by g_points_to_array
+POINT_DTYPE = np.dtype([("x", "f8"),
+                        ("y", "f8"),
+                        ("pos_x", "f8"),
+                        ("pos_y", "f8"),
+                        ("frame", "i4"),
+                        ("region", "i4")])
+
+## the fields of a line marker in the arrays made by g_lines_to_array
+LINE_DTYPE = np.dtype([("x1", "f8"),
+                       ("y1", "f8"),
+                       ("x2", "f8"),
+                       ("y2", "f8"),
+                       ("pos_x", "f8"),
+                       ("pos_y", "f8"),
+                       ("frame", "i4"),
+                       ("region", "i4")])
+
 def g_point_to_tuple(point):
     """
     convert the data in a QGraphicsPathItem reprsenting a point to a tuple
@@ -259,17 +339,15 @@ def g_point_to_tuple(point):
         Returns:
             list [x1, y1, px, py, frame]
     """
-    array = []
     centre = point.data(ItemDataTypes.CROSS_CENTRE)
     position = point.pos()
-    array.append(centre.x())
-    array.append(centre.y())
-    array.append(position.x())
-    array.append(position.y())
-    array.append(point.data(ItemDataTypes.FRAME_NUMBER))
-    array.append(point.data(ItemDataTypes.REGION_INDEX))
 
-    return array
+    return [centre.x(),
+            centre.y(),
+            position.x(),
+            position.y(),
+            point.data(ItemDataTypes.FRAME_NUMBER),
+            point.data(ItemDataTypes.REGION_INDEX)]
 
 def g_line_to_tuple(line):
     """
@@ -279,17 +357,39 @@ def g_line_to_tuple(line):
         Returns:
             list [x1, y1, x2, y2, px, py, frame]
     """
-    array = []
-    array.append(line.line().x1())
-    array.append(line.line().y1())
-    array.append(line.line().x2())
-    array.append(line.line().y2())
-    array.append(line.pos().x())
-    array.append(line.pos().y())
-    array.append(line.data(ItemDataTypes.FRAME_NUMBER))
-    array.append(line.data(ItemDataTypes.REGION_INDEX))
+    q_line = line.line()
+    position = line.pos()
 
-    return array
+    return [q_line.x1(),
+            q_line.y1(),
+            q_line.x2(),
+            q_line.y2(),
+            position.x(),
+            position.y(),
+            line.data(ItemDataTypes.FRAME_NUMBER),
+            line.data(ItemDataTypes.REGION_INDEX)]
+
+def g_points_to_array(points):
+    """
+    convert the data in a list of QGraphicsPathItems representing points to a structured array
+        Args:
+            points ([QGraphicsPathItem]) the points for conversion
+        Returns:
+            numpy array of POINT_DTYPE, one record per point
+    """
+    return np.array([tuple(g_point_to_tuple(point)) for point in points],
+                    dtype=POINT_DTYPE)
+
+def g_lines_to_array(lines):
+    """
+    convert the data in a list of QGraphicsLineItems to a structured array
+        Args:
+            lines ([QGraphicsLineItem]) the lines for conversion
+        Returns:
+            numpy array of LINE_DTYPE, one record per line
+    """
+    return np.array([tuple(g_line_to_tuple(line)) for line in lines],
+                    dtype=LINE_DTYPE)
 
 def list_to_g_point(point, pen):
     """
@@ -322,6 +422,17 @@ def list_to_g_point(point, pen):
 
     return item
 
+def list_to_g_points(points, pen):
+    """
+    convert a list of points in list form to graphics points sharing one pen
+        Args:
+            points ([list [ID, x, y, pos_x, pos_y, frame, region]]) the points as lists
+            pen (QPen) the drawing pen
+        Returns:
+            [QGraphicsPathItem]
+    """
+    return [list_to_g_point(point, pen) for point in points]
+
 def list_to_g_line(line, pen):
     """
     convert the data in a list to a graphics line
@@ -352,6 +463,17 @@ def list_to_g_line(line, pen):
 
     return item
 
+def list_to_g_lines(lines, pen):
+    """
+    convert a list of lines in list form to graphics lines sharing one pen
+        Args:
+            lines ([list [ID, x1, y1, x2, y2, pos_x, pos_y, frame, region]]) the lines as lists
+            pen (QPen) the drawing pen
+        Returns:
+            [QGraphicsLineItem]
+    """
+    return [list_to_g_line(line, pen) for line in lines]
+
 def get_rect_even_dimensions(rect_item, even_dimensions=True):
     """
     get the the graphics rectangle of the item, moved to position, with sides of even length
@@ -370,13 +492,12 @@ def get_rect_even_dimensions(rect_item, even_dimensions=True):
     if not even_dimensions:
         return rect
 
-    if width%2 == 1:
-        rect.setWidth(width+1)
-
-    if height%2 == 1:
-        rect.setHeight(height+1)
+    # adding the lowest bit rounds odd lengths up to the next even number
+    rect.setWidth(width + (width & 1))
+    rect.setHeight(height + (height & 1))
 
     return rect
+
 def compare_lines(first, second):
     """
     compare the lines withing two line items
@@ -25,7 +25,7 @@ import PyQt5.QtCore as qc
 import PyQt5.QtWidgets as qw
 
 from cgt.gui.penstore import PenStore
-from cgt.util.scenegraphitems import list_to_g_line, list_to_g_point
+from cgt.util.scenegraphitems import list_to_g_lines, list_to_g_points
 from cgt.model.videoanalysisresultsstore import VideoAnalysisResultsStore
 
 ## store for test values
@@ -107,11 +107,7 @@ def make_test_points():
     string_lists.append(["0", "0", "0", "100", "50", "300", "0"])
 
     pen = PenStore()
-    points = []
-    for string_list in string_lists:
-        points.append(list_to_g_point(string_list, pen.get_display_pen()))
-
-    return points
+    return list_to_g_points(string_lists, pen.get_display_pen())
 
 def make_test_lines():
     """
@@ -125,8 +121,4 @@ def make_test_lines():
     line_lists.append(["0", "20", "20", "20", "220", "50", "0", "150", "1"])
 
     pen = PenStore()
-    lines = []
-    for line_list in line_lists:
-        lines.append(list_to_g_line(line_list, pen.get_display_pen()))
-
-    return lines
+    return list_to_g_lines(line_lists, pen.get_display_pen())
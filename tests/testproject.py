@@ -22,7 +22,9 @@ This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
 @author: j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
 '''
 import unittest
+from unittest import mock
 import getpass
+import socket
 
 from cgt.util.utils import find_hostname_and_ip
 from cgt.model.cgtproject import CGTProject
@@ -50,6 +52,7 @@ class TestProject(unittest.TestCase):
         test if a new project is created correctly
         """
         host, ip_address, operating_system = find_hostname_and_ip()
+        self._project.wait_for_host_info()
 
         message = "wrong host name"
         self.assertEqual(self._project['host'], host, message)
@@ -60,6 +63,30 @@ class TestProject(unittest.TestCase):
         message = "wrong user name"
         self.assertEqual(self._project["start_user"], getpass.getuser(), message)
 
+    def test_failed_host_lookup(self):
+        """
+        test a failing host lookup leaves the host data undetermined and does not block
+        """
+        project = CGTProject()
+        with mock.patch("cgt.model.cgtproject.find_hostname_and_ip",
+                        side_effect=socket.gaierror("no such host")):
+            project.init_new_project()
+            project.wait_for_host_info()
+
+        message = "host data not undetermined after failed lookup"
+        for key in ('host', 'ip_address', 'operating_system'):
+            self.assertEqual(project[key], 'undetermined', message)
+
+    def test_empty_project_unchanged(self):
+        """
+        test a newly constructed project is not in the changed state
+        """
+        project = CGTProject()
+        message = "empty project in changed state"
+        self.assertFalse(project.has_been_changed(), message)
+        message = "wrong default for stats_from_enhanced"
+        self.assertFalse(project["stats_from_enhanced"], message)
+
     def test_add_data(self):
         """
         ensure numeric data are not string
@@ -77,5 +104,28 @@ class TestProject(unittest.TestCase):
         message = "project not in unchanged state after reset"
         self.assertFalse(self._project.has_been_changed(), message)
 
+    def test_numeric_data_unset(self):
+        """
+        ensure unset numeric data are not converted to nan
+        """
+        self._project["frame_rate"] = "22"
+        self._project.ensure_numeric()
+        message = "unset resolution not left as None"
+        self.assertIsNone(self._project["resolution"], message)
+        message = "error in frame rate"
+        self.assertEqual(self._project["frame_rate"], 22.0, message)
+
+    def test_numeric_data_unchanged(self):
+        """
+        ensure numeric data already in numpy form is left unchanged
+        """
+        self._project["resolution"] = "8.1"
+        self._project["frame_rate"] = "22"
+        self._project.ensure_numeric()
+        self._project.reset_changed()
+        self._project.ensure_numeric()
+        message = "project changed by conversion of numeric data"
+        self.assertFalse(self._project.has_been_changed(), message)
+
 if __name__ == "__main__":
     unittest.main()
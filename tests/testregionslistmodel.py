@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+## @package testregionslistmodel
+# unittests of the regions list model
+#
+# @copyright 2021 University of Leeds, Leeds, UK.
+# @author j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
+'''
+Created on 15 Oct 2021
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use
+this file except in compliance with the License. You may obtain a copy of the
+License at http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed
+under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+
+This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
+
+@copyright 2021
+@author: j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
+'''
+# set up linting conditions
+# pylint: disable = c-extension-no-member
+import unittest
+
+import PyQt5.QtCore as qc
+
+from cgt.gui.regionslistmodel import RegionsListModel
+from tests.makeresults import make_results_object
+
+class TestRegionsListModel(unittest.TestCase):
+    """
+    test the list model of regions
+    """
+
+    def setUp(self):
+        """
+        build a model with no results
+        """
+        self._model = RegionsListModel()
+
+    def tearDown(self):
+        """
+        clean up
+        """
+        del self._model
+
+    def test_no_results(self):
+        """
+        test a model without results has no rows
+        """
+        message = "model without results has rows"
+        self.assertEqual(self._model.rowCount(), 0, message)
+
+    def test_with_results(self):
+        """
+        test the rows and labels of a model with results
+        """
+        self._model.set_results(make_results_object())
+
+        message = "wrong number of rows"
+        self.assertEqual(self._model.rowCount(), 2, message)
+
+        index = self._model.index(1)
+        message = "wrong display label"
+        self.assertEqual(self._model.data(index, qc.Qt.DisplayRole), "1", message)
+
+        value = self._model.data(index, qc.Qt.ToolTipRole)
+        message = "non display role returned data"
+        self.assertIsInstance(value, qc.QVariant, message)
+        self.assertFalse(value.isValid(), message)
+
+        self._model.set_results(None)
+        message = "rows remain after results removed"
+        self.assertEqual(self._model.rowCount(), 0, message)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,6 +63,17 @@ class TestResults(unittest.TestCase):
         message = "store in state unchanged"
         self.assertTrue(self._store.has_been_changed(), message)
 
+    def test_change_count(self):
+        """
+        test the change count advances on change and survives a reset of the changed flag
+        """
+        count = self._store.get_change_count()
+        self._store.reset_changed()
+        self.add_region()
+
+        message = "change count did not advance"
+        self.assertEqual(self._store.get_change_count(), count+1, message)
+
     def test_add_region(self):
         """
         test the addition of a region
@@ -91,6 +102,23 @@ class TestResults(unittest.TestCase):
         message = "key frame wrong"
         self.assertEqual(frame, frames[0], message)
 
+    def test_markers_for_region(self):
+        """
+        test the counting of markers associated with a region
+        """
+        message = "wrong number of lines in region 1"
+        self.assertEqual(self._store.number_of_lines_for_region(1), 1, message)
+        message = "wrong number of points in region 0"
+        self.assertEqual(self._store.number_of_points_for_region(0), 1, message)
+        message = "wrong number of lines in region 0"
+        self.assertEqual(self._store.number_of_lines_for_region(0), 0, message)
+
+        self.add_region()
+        message = "new region reported as having markers"
+        self.assertFalse(self._store.region_has_markers(2), message)
+        message = "region 1 reported as having no markers"
+        self.assertTrue(self._store.region_has_markers(1), message)
+
     def add_region(self):
         """
         add a region
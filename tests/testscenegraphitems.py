@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+## @package testscenegraphitems
+# unittests of the scene graph item functions
+#
+# @copyright 2021 University of Leeds, Leeds, UK.
+# @author j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
+'''
+Created on 15 Oct 2021
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use
+this file except in compliance with the License. You may obtain a copy of the
+License at http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed
+under the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+CONDITIONS OF ANY KIND, either express or implied. See the License for the
+specific language governing permissions and limitations under the License.
+
+This work was funded by Joanna Leng's EPSRC funded RSE Fellowship (EP/R025819/1)
+
+@copyright 2021
+@author: j.h.pickering@leeds.ac.uk and j.leng@leeds.ac.uk
+'''
+# set up linting conditions
+# pylint: disable = c-extension-no-member
+import unittest
+from math import isnan
+
+import PyQt5.QtCore as qc
+import PyQt5.QtWidgets as qw
+
+from cgt.util.scenegraphitems import (LinePairIntersector,
+                                      cgt_intersection,
+                                      g_points_to_array,
+                                      g_lines_to_array,
+                                      perpendicular_dist_to_position)
+import tests.makeresults as mkres
+
+class TestIntersection(unittest.TestCase):
+    """
+    test the intersection of normals with clone lines
+    """
+
+    def setUp(self):
+        """
+        make a vertical clone line from (10, 0) to (10, 10)
+        """
+        self._clone = qc.QLineF(10.0, 0.0, 10.0, 10.0)
+
+    def tearDown(self):
+        """
+        clean up
+        """
+        del self._clone
+
+    def test_intersection_inside(self):
+        """
+        test a normal crossing the clone segment
+        """
+        normal = qc.QLineF(0.0, 5.0, 1.0, 5.0)
+        intersection, extension = cgt_intersection(normal, self._clone)
+
+        message = "wrong intersection point"
+        self.assertAlmostEqual(intersection.x(), 10.0, places=6, msg=message)
+        self.assertAlmostEqual(intersection.y(), 5.0, places=6, msg=message)
+        message = "extension made for intersection inside clone"
+        self.assertIsNone(extension, message)
+
+    def test_intersection_extension(self):
+        """
+        test normals crossing beyond each end of the clone, reusing one intersector
+        """
+        intersector = LinePairIntersector(self._clone)
+
+        intersection, extension = intersector.intersect(qc.QLineF(0.0, 15.0, 1.0, 15.0))
+        message = "wrong extension beyond p2"
+        self.assertEqual(extension, qc.QLineF(self._clone.p2(), intersection), message)
+
+        intersection, extension = intersector.intersect(qc.QLineF(0.0, -5.0, 1.0, -5.0))
+        message = "wrong extension beyond p1"
+        self.assertEqual(extension, qc.QLineF(self._clone.p1(), intersection), message)
+
+    def test_parallel(self):
+        """
+        test parallel lines raise an error
+        """
+        normal = qc.QLineF(0.0, 0.0, 0.0, 1.0)
+        with self.assertRaises(ArithmeticError):
+            cgt_intersection(normal, self._clone)
+
+class TestExport(unittest.TestCase):
+    """
+    test the export of markers to structured arrays
+    """
+
+    def test_points_to_array(self):
+        """
+        test the point marker fields are exported in order
+        """
+        array = g_points_to_array(mkres.make_test_points())
+
+        message = "wrong number of points"
+        self.assertEqual(len(array), 3, message)
+        message = "wrong point record"
+        self.assertEqual(array[1].tolist(), (0.0, 0.0, 50.0, 25.0, 200, 0), message)
+
+    def test_lines_to_array(self):
+        """
+        test the line marker fields are exported in order
+        """
+        array = g_lines_to_array(mkres.make_test_lines())
+
+        message = "wrong number of lines"
+        self.assertEqual(len(array), 2, message)
+        message = "wrong line record"
+        self.assertEqual(array[1].tolist(), (20.0, 20.0, 20.0, 220.0, 50.0, 0.0, 150, 1), message)
+        message = "wrong frames"
+        self.assertEqual(array["frame"].tolist(), [50, 150], message)
+
+class TestPerpendicularDistance(unittest.TestCase):
+    """
+    test the distance of a line's position along its normal
+    """
+
+    def test_distance(self):
+        """
+        test a vertical line moved horizontally
+        """
+        line = qw.QGraphicsLineItem(0.0, 0.0, 0.0, 10.0)
+        line.setPos(3.0, 0.0)
+
+        message = "wrong perpendicular distance"
+        self.assertAlmostEqual(perpendicular_dist_to_position(line, 2.0), 6.0,
+                               places=6, msg=message)
+
+    def test_zero_length_line(self):
+        """
+        test a zero length line gives nan rather than raising
+        """
+        line = qw.QGraphicsLineItem(5.0, 5.0, 5.0, 5.0)
+        line.setPos(3.0, 4.0)
+
+        message = "zero length line did not give nan"
+        self.assertTrue(isnan(perpendicular_dist_to_position(line, 1.0)), message)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -21,8 +21,10 @@ specific language governing permissions and limitations under the License.
 # pylint: disable = c-extension-no-member
 
 import unittest
+from collections import namedtuple
 
 from cgt.util.markers import MarkerTypes
+from cgt.util.scenegraphitems import difference_list_to_velocities
 from cgt.model.velocitiescalculator import (ScreenDisplacement,
                                             VelocitiesCalculator)
 import tests.makeresults as mkres
@@ -125,5 +127,41 @@ class TestVelocities(unittest.TestCase):
                                        places=4,
                                        msg=message)
 
+## stand in for a line difference, only the average is used
+Difference = namedtuple("Difference", ["average"])
+
+class TestDifferenceVelocities(unittest.TestCase):
+    """
+    test the conversion of line differences to velocities
+    """
+
+    def test_velocities(self):
+        """
+        test speed is |average|*scale*fps/frames, including negative averages
+        """
+        diff_list = [(2, Difference(-3.0)), (4, Difference(5.0))]
+        velocities = difference_list_to_velocities(diff_list, 1.5, 10.0)
+
+        message = "wrong number of velocities"
+        self.assertEqual(len(velocities), 2, message)
+        message = "wrong velocity for negative average"
+        self.assertAlmostEqual(velocities[0], 22.5, places=6, msg=message)
+        message = "wrong velocity for positive average"
+        self.assertAlmostEqual(velocities[1], 18.75, places=6, msg=message)
+
+    def test_empty(self):
+        """
+        test an empty list gives no velocities
+        """
+        message = "empty input did not give empty list"
+        self.assertEqual(difference_list_to_velocities([], 1.5, 10.0), [], message)
+
+    def test_zero_interval(self):
+        """
+        test a zero frame interval is rejected
+        """
+        with self.assertRaises(ZeroDivisionError):
+            difference_list_to_velocities([(0, Difference(1.0))], 1.5, 10.0)
+
 if __name__ == "__main__":
     unittest.main()
@@ -35,13 +35,18 @@ class TestVideoControls(unittest.TestCase):
     test the video control widget
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        build a full test class
+        make the QApplication once for all the tests
         """
         ## the QApplication
-        self.app = qw.QApplication([])
+        cls.app = qw.QApplication.instance() or qw.QApplication([])
 
+    def setUp(self):
+        """
+        build a full test class
+        """
         ## the widget
         self._controller = CGTVideoControls()
 